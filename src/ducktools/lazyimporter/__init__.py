@@ -23,7 +23,6 @@
 Tools to make a lazy importer object that can be set up to import
 when first accessed.
 """
-import abc
 import os
 import sys
 
@@ -39,6 +38,7 @@ __all__ = [
     "ImportBase",
     "get_importer_state",
     "get_module_funcs",
+    "install_lazy",
     "force_imports",
 ]
 
@@ -46,54 +46,170 @@ EAGER_PROCESS = os.environ.get("DUCKTOOLS_EAGER_PROCESS", "false").lower() != "f
 EAGER_IMPORT = os.environ.get("DUCKTOOLS_EAGER_IMPORT", "false").lower() != "false"
 
 
-class ImportBase(metaclass=abc.ABCMeta):
-    module_name: str
+def _get_loaded_module(name):
+    """
+    Get a module from sys.modules only if it has finished initializing.
 
-    @property
-    def module_name_noprefix(self):
-        return self.module_name.lstrip(".")
+    Partially initialized modules are left to __import__ so the import lock
+    is respected.
 
-    @property
-    def import_level(self):
-        level = 0
-        for char in self.module_name:
-            if char != ".":
-                break
-            level += 1
-        return level
+    :param name: Absolute name of the module
+    :type name: str
+    :return: The module if it is fully loaded, otherwise None
+    :rtype: types.ModuleType | None
+    """
+    mod = sys.modules.get(name)
+    if mod is not None:
+        spec = getattr(mod, "__spec__", None)
+        if not getattr(spec, "_initializing", False):
+            return mod
+    return None
+
+
+# Parsed module names shared between importers that use the same module
+_MODULE_NAME_CACHE = {}
+
+
+def _parse_module_name(module_name):
+    """
+    Split a module name into the parts needed to perform the import.
+
+    eg: '..importlib.util' -> ('..importlib.util', 'importlib.util', 2, 'importlib', ('util',))
+
+    :param module_name: name of the module, including any leading '.' characters
+    :type module_name: str
+    :return: module name, name without prefix, import level,
+             base module name and submodule names
+    :rtype: tuple[str, str, int, str, tuple[str, ...]]
+    """
+    parts = _MODULE_NAME_CACHE.get(module_name)
+    if parts is None:
+        # Interned as these are used as keys for sys.modules lookups
+        noprefix = sys.intern(module_name.lstrip("."))
+
+        # The number of leading '.' characters
+        level = len(module_name) - len(noprefix)
+
+        module_basename, *submodule_names = noprefix.split(".")
+
+        parts = _MODULE_NAME_CACHE[module_name] = (
+            sys.intern(module_name),
+            noprefix,
+            level,
+            sys.intern(module_basename),
+            tuple(submodule_names),
+        )
+    return parts
+
+
+# Validated and interned identifiers shared between importers
+_IDENTIFIER_CACHE = {}
+
+
+def _validate_identifier(name):
+    """
+    Check that a name can be used as an attribute name and return it interned.
+
+    :param name: Name to be used as the attribute name of an import
+    :type name: str
+    :return: The interned name
+    :rtype: str
+    :raises ValueError: If the name is not a valid Python identifier
+    """
+    valid_name = _IDENTIFIER_CACHE.get(name)
+    if valid_name is None:
+        # keyword is only needed when a new name is seen
+        from keyword import iskeyword
+
+        if not name.isidentifier() or iskeyword(name):
+            raise ValueError(f"{name!r} is not a valid Python identifier.")
+        valid_name = _IDENTIFIER_CACHE[name] = sys.intern(name)
+    return valid_name
+
+
+class ImportBase:
+    __slots__ = (
+        "_module_name",
+        "module_name_noprefix",
+        "import_level",
+        "module_basename",
+        "submodule_names",
+        "__weakref__",
+    )
+
+    # Names of the attributes shown by __repr__ and used for comparisons, in order
+    _fields = None
+
+    # The names derived from module_name are used on every import so they are
+    # worked out once when module_name is set instead of on each access.
+    module_name_noprefix: str
+    import_level: int
+    module_basename: str
+    submodule_names: "tuple[str, ...]"
 
     @property
-    def module_basename(self):
+    def module_name(self):
         """
-        Get the first part of a module import name.
-        eg: 'importlib' from 'importlib.util'
+        Name of the module to import, including any leading '.' characters
+        for relative imports.
+
+        Setting this also sets module_name_noprefix, import_level,
+        module_basename and submodule_names.
 
-        :return: name of base module
         :rtype: str
         """
-        return self.module_name_noprefix.split(".")[0]
+        return self._module_name
 
-    @property
-    def submodule_names(self):
-        """
-        Get a list of all submodule names in order.
-        eg: ['util'] from 'importlib.util'
-        :return: List of submodule names.
-        :rtype: list[str]
-        """
-        return self.module_name_noprefix.split(".")[1:]
+    @module_name.setter
+    def module_name(self, value):
+        (
+            self._module_name,
+            self.module_name_noprefix,
+            self.import_level,
+            self.module_basename,
+            self.submodule_names,
+        ) = _parse_module_name(value)
+
+    def __repr__(self):
+        fields = self._fields
+        if fields is None:
+            return super().__repr__()
+
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in fields)
+        return f"{type(self).__name__}({args})"
+
+    def _key(self):
+        # Values of the fields used for equality and hashing
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other):
+        # Comparisons between different importer types are the common
+        # mismatch, check the type before anything else
+        if type(self) is not type(other) or self._fields is None:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        if self._fields is None:
+            return super().__hash__()
+        return hash((self.__class__, self._key()))
 
-    @abc.abstractmethod
     def import_objects(self, globs=None):
         """
         Perform the imports defined and return a dictionary.
 
+        Must be implemented by subclasses.
+
         :return: dict of {name: imported_object, ...} for all names
         :rtype: dict[str, typing.Any]
         """
+        raise NotImplementedError
 
 
 class ModuleImport(ImportBase):
+    __slots__ = ("asname",)
+    _fields = ("module_name", "asname")
+
     module_name: str
     asname: str
 
@@ -122,36 +238,30 @@ class ModuleImport(ImportBase):
         else:
             self.asname = asname
 
-        if not self.asname.isidentifier():
-            raise ValueError(f"{self.asname!r} is not a valid Python identifier.")
-
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}("
-            f"module_name={self.module_name!r}, "
-            f"asname={self.asname!r}"
-            f")"
-        )
-
-    def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return (self.module_name, self.asname) == (other.module_name, other.asname)
-        return NotImplemented
+        self.asname = _validate_identifier(self.asname)
 
     def import_objects(self, globs=None):
-        mod = __import__(
-            self.module_name_noprefix,
-            globals=globs,
-            level=self.import_level,
-        )
+        mod = None
+        if self.import_level == 0:
+            mod = _get_loaded_module(self.module_name)
 
-        for submod in self.submodule_names:
-            mod = getattr(mod, submod)
+        if mod is None:
+            mod = __import__(
+                self.module_name_noprefix,
+                globals=globs,
+                level=self.import_level,
+            )
+
+            for submod in self.submodule_names:
+                mod = getattr(mod, submod)
 
         return {self.asname: mod}
 
 
 class FromImport(ImportBase):
+    __slots__ = ("attrib_name", "asname")
+    _fields = ("module_name", "attrib_name", "asname")
+
     module_name: str
     attrib_name: str
     asname: str
@@ -169,45 +279,35 @@ class FromImport(ImportBase):
         :type asname: str | None
         """
         self.module_name = module_name
-        self.attrib_name = attrib_name
+        self.attrib_name = sys.intern(attrib_name)
         self.asname = asname if asname is not None else attrib_name
 
-        if not self.asname.isidentifier():
-            raise ValueError(f"{self.asname!r} is not a valid Python identifier.")
+        self.asname = _validate_identifier(self.asname)
 
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}("
-            f"module_name={self.module_name!r}, "
-            f"attrib_name={self.attrib_name!r}, "
-            f"asname={self.asname!r}"
-            f")"
-        )
+    def import_objects(self, globs=None):
+        mod = None
+        if self.import_level == 0:
+            mod = _get_loaded_module(self.module_name)
 
-    def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return (self.module_name, self.attrib_name, self.asname) == (
-                other.module_name,
-                self.attrib_name,
-                other.asname,
+        # The attribute may be a submodule that has not been imported yet
+        if mod is None or not hasattr(mod, self.attrib_name):
+            mod = __import__(
+                self.module_name_noprefix,
+                globals=globs,
+                fromlist=[self.attrib_name],
+                level=self.import_level,
             )
-        return NotImplemented
-
-    def import_objects(self, globs=None):
-        # Perform the import
-        mod = __import__(
-            self.module_name_noprefix,
-            globals=globs,
-            fromlist=[self.attrib_name],
-            level=self.import_level,
-        )
 
         return {self.asname: getattr(mod, self.attrib_name)}
 
 
 class MultiFromImport(ImportBase):
+    __slots__ = ("attrib_pairs", "asnames")
+    _fields = ("module_name", "attrib_names")
+
     module_name: str
-    attrib_names: "list[str | tuple[str, str]]"
+    attrib_pairs: "tuple[tuple[str, str], ...]"
+    asnames: "tuple[str, ...]"
 
     def __init__(self, module_name, attrib_names):
         """
@@ -222,107 +322,132 @@ class MultiFromImport(ImportBase):
         :type attrib_names: list[str | tuple[str, str]]
         """
         self.module_name = module_name
-        self.attrib_names = attrib_names
 
-        for name in self.asnames:
-            if not name.isidentifier():
-                raise ValueError(f"{name!r} is not a valid Python identifier.")
-
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}("
-            f"module_name={self.module_name!r}, "
-            f"attrib_names={self.attrib_names!r})"
-        )
+        # Normalise to (attribute, asname) pairs once so importing doesn't
+        # need to check the type of each entry
+        attrib_pairs = []
+        asnames = []
+        for item in attrib_names:
+            if isinstance(item, str):
+                attrib, asname = item, item
+            else:
+                attrib, asname = item
+            asname = _validate_identifier(asname)
+            attrib_pairs.append((sys.intern(attrib), asname))
+            asnames.append(asname)
 
-    def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return (self.module_name, self.attrib_names) == (
-                other.module_name,
-                other.attrib_names,
-            )
-        return NotImplemented
+        # Stored as tuples so they can't be changed after validation
+        self.attrib_pairs = tuple(attrib_pairs)
+        self.asnames = tuple(asnames)
 
     @property
-    def asnames(self):
+    def attrib_names(self):
         """
-        Get a list of all the names that will be assigned by this importer
+        Attributes or (attribute, asname) pairs to import, built from
+        attrib_pairs so this always matches what will be imported.
 
-        :return: list of 'asname' names to give as 'dir' for LazyImporter bindings
-        :rtype: list[str]
+        :rtype: list[str | tuple[str, str]]
         """
-        names = []
-        for item in self.attrib_names:
-            if isinstance(item, str):
-                names.append(item)
-            else:
-                names.append(item[1])
+        return [
+            attrib if attrib == asname else (attrib, asname)
+            for attrib, asname in self.attrib_pairs
+        ]
 
-        return names
+    def _key(self):
+        return self.module_name, self.attrib_pairs
 
     def import_objects(self, globs=None):
-        from_imports = {}
-
-        # Perform the import
-        mod = __import__(
-            self.module_name_noprefix,
-            globals=globs,
-            fromlist=self.asnames,
-            level=self.import_level,
-        )
-
-        for name in self.attrib_names:
-            if isinstance(name, str):
-                from_imports[name] = getattr(mod, name)
-            else:
-                from_imports[name[1]] = getattr(mod, name[0])
+        mod = None
+        if self.import_level == 0:
+            mod = _get_loaded_module(self.module_name)
+
+        # Attributes may be submodules that have not been imported yet
+        if mod is None or not all(
+            hasattr(mod, attrib) for attrib, _ in self.attrib_pairs
+        ):
+            mod = __import__(
+                self.module_name_noprefix,
+                globals=globs,
+                fromlist=[attrib for attrib, _ in self.attrib_pairs],
+                level=self.import_level,
+            )
 
-        return from_imports
+        return {asname: getattr(mod, attrib) for attrib, asname in self.attrib_pairs}
 
 
-class _TryExceptImportMixin(metaclass=abc.ABCMeta):
-    except_module: str
+class _TryExceptImportMixin(ImportBase):
+    __slots__ = (
+        "_except_module",
+        "except_module_noprefix",
+        "except_import_level",
+        "except_module_basename",
+        "except_module_names",
+    )
 
-    @property
-    def except_import_level(self):
-        level = 0
-        for char in self.except_module:
-            if char != ".":
-                break
-            level += 1
-        return level
+    except_module_noprefix: str
+    except_import_level: int
+    except_module_basename: str
+    except_module_names: "tuple[str, ...]"
 
     @property
-    def except_module_noprefix(self):
-        """
-        Remove any leading '.' characters from the except_module name.
-        :return:
+    def except_module(self):
         """
-        return self.except_module.lstrip(".")
+        Name of the module to import if the 'try' import fails.
 
-    @property
-    def except_module_basename(self):
-        """
-        Get the first part of an except module import name.
-        eg: 'importlib' from 'importlib.util'
+        Setting this also sets except_module_noprefix, except_import_level,
+        except_module_basename and except_module_names.
 
-        :return: name of base module
         :rtype: str
         """
-        return self.except_module_noprefix.split(".")[0]
-
-    @property
-    def except_module_names(self):
+        return self._except_module
+
+    @except_module.setter
+    def except_module(self, value):
+        (
+            self._except_module,
+            self.except_module_noprefix,
+            self.except_import_level,
+            self.except_module_basename,
+            self.except_module_names,
+        ) = _parse_module_name(value)
+
+    def _import_module(self, globs=None):
         """
-        Get a list of all except submodule names in order.
-        eg: ['util'] from 'importlib.util'
-        :return: List of submodule names.
-        :rtype: list[str]
+        Import the 'try' module or the 'except' module if that fails.
+
+        :param globs: globals object for relative imports
+        :type globs: dict[str, typing.Any] | None
+        :return: the imported module and if the 'except' module was used
+        :rtype: tuple[types.ModuleType, bool]
         """
-        return self.except_module_noprefix.split(".")[1:]
+        try:
+            mod = __import__(
+                self.module_name_noprefix,
+                globals=globs,
+                level=self.import_level,
+            )
+        except ImportError:
+            mod = __import__(
+                self.except_module_noprefix,
+                globals=globs,
+                level=self.except_import_level,
+            )
+            submodule_names = self.except_module_names
+            used_fallback = True
+        else:
+            submodule_names = self.submodule_names
+            used_fallback = False
+
+        for submod in submodule_names:
+            mod = getattr(mod, submod)
+
+        return mod, used_fallback
 
 
 class TryExceptImport(_TryExceptImportMixin, ImportBase):
+    __slots__ = ("asname",)
+    _fields = ("module_name", "except_module", "asname")
+
     module_name: str
     except_module: str
     asname: str
@@ -352,55 +477,28 @@ class TryExceptImport(_TryExceptImportMixin, ImportBase):
         self.except_module = except_module
         self.asname = asname
 
-        if not self.asname.isidentifier():
-            raise ValueError(f"{self.asname!r} is not a valid Python identifier.")
-
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}("
-            f"module_name={self.module_name!r}, "
-            f"except_module={self.except_module!r}, "
-            f"asname={self.asname!r}"
-            f")"
-        )
-
-    def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return (self.module_name, self.except_module, self.asname) == (
-                other.module_name,
-                other.except_module,
-                other.asname,
-            )
-        return NotImplemented
+        self.asname = _validate_identifier(self.asname)
 
     def import_objects(self, globs=None):
-        try:
-            mod = __import__(
-                self.module_name_noprefix,
-                globals=globs,
-                level=self.import_level,
-            )
-        except ImportError:
-            mod = __import__(
-                self.except_module_noprefix,
-                globals=globs,
-                level=self.except_import_level,
-            )
-            submod_used = [self.except_module_basename]
-            submodule_names = self.except_module_names
-
-        else:
-            submod_used = [self.module_basename]
-            submodule_names = self.submodule_names
-
-        for submod in submodule_names:
-            submod_used.append(submod)
-            mod = getattr(mod, submod)
+        if self.import_level == 0:
+            mod = _get_loaded_module(self.module_name)
+            if mod is not None:
+                return {self.asname: mod}
 
+        mod, _ = self._import_module(globs)
         return {self.asname: mod}
 
 
 class TryExceptFromImport(_TryExceptImportMixin, ImportBase):
+    __slots__ = ("attribute_name", "except_attribute", "asname")
+    _fields = (
+        "module_name",
+        "attribute_name",
+        "except_module",
+        "except_attribute",
+        "asname",
+    )
+
     module_name: str
     attribute_name: str
     except_module: str
@@ -437,61 +535,15 @@ class TryExceptFromImport(_TryExceptImportMixin, ImportBase):
         self.attribute_name = attribute_name
         self.except_attribute = except_attribute
 
-        if not self.asname.isidentifier():
-            raise ValueError(f"{self.asname!r} is not a valid Python identifier.")
-
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}("
-            f"module_name={self.module_name!r}, "
-            f"attribute_name={self.attribute_name!r}, "
-            f"except_module={self.except_module!r}, "
-            f"except_attribute={self.except_attribute!r}, "
-            f"asname={self.asname!r}"
-            f")"
-        )
-
-    def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return (
-                self.module_name,
-                self.attribute_name,
-                self.except_module,
-                self.except_attribute,
-                self.asname,
-            ) == (
-                other.module_name,
-                other.attribute_name,
-                other.except_module,
-                other.except_attribute,
-                other.asname,
-            )
-        return NotImplemented
+        self.asname = _validate_identifier(self.asname)
 
     def import_objects(self, globs=None):
-        try:
-            mod = __import__(
-                self.module_name_noprefix,
-                globals=globs,
-                level=self.import_level,
-            )
-        except ImportError:
-            mod = __import__(
-                self.except_module_noprefix,
-                globals=globs,
-                level=self.except_import_level,
-            )
-            submod_used = [self.except_module_basename]
-            submodule_names = self.except_module_names
-            used_fallback = True
-        else:
-            submod_used = [self.module_basename]
-            submodule_names = self.submodule_names
-            used_fallback = False
+        if self.import_level == 0:
+            mod = _get_loaded_module(self.module_name)
+            if mod is not None and hasattr(mod, self.attribute_name):
+                return {self.asname: getattr(mod, self.attribute_name)}
 
-        for submod in submodule_names:
-            submod_used.append(submod)
-            mod = getattr(mod, submod)
+        mod, used_fallback = self._import_module(globs)
 
         if used_fallback:
             attrib = getattr(mod, self.except_attribute)
@@ -502,6 +554,9 @@ class TryExceptFromImport(_TryExceptImportMixin, ImportBase):
 
 
 class TryFallbackImport(ImportBase):
+    __slots__ = ("fallback", "asname")
+    _fields = ("module_name", "fallback", "asname")
+
     def __init__(self, module_name, fallback, asname=None):
         self.module_name = module_name
         self.fallback = fallback
@@ -519,32 +574,14 @@ class TryFallbackImport(ImportBase):
         else:
             self.asname = asname
 
-        if not self.asname.isidentifier():
-            raise ValueError(f"{self.asname!r} is not a valid Python identifier.")
-
-    def __repr__(self):
-        return (
-            f"{self.__class__.__name__}("
-            f"module_name={self.module_name!r}, "
-            f"fallback={self.fallback!r}, "
-            f"asname={self.asname!r}"
-            f")"
-        )
-
-    def __eq__(self, other):
-        if self.__class__ is other.__class__:
-            return (
-                self.module_name,
-                self.fallback,
-                self.asname,
-            ) == (
-                other.module_name,
-                other.fallback,
-                other.asname,
-            )
-        return NotImplemented
+        self.asname = _validate_identifier(self.asname)
 
     def import_objects(self, globs=None):
+        if self.import_level == 0:
+            mod = _get_loaded_module(self.module_name)
+            if mod is not None:
+                return {self.asname: mod}
+
         try:
             mod = __import__(
                 self.module_name_noprefix,
@@ -560,81 +597,122 @@ class TryFallbackImport(ImportBase):
         return {self.asname: mod}
 
 
-class _ImporterGrouper:
-    def __init__(self):
-        self._name = None
+# Importers from this module that define a single 'asname'
+_SINGLE_NAME_IMPORTS = frozenset(
+    {ModuleImport, FromImport, TryExceptImport, TryExceptFromImport, TryFallbackImport}
+)
 
-    def __set_name__(self, owner, name):
-        self._name = name
 
-    def __get__(self, inst, cls=None):
-        if inst:
-            importers = self.group_importers(inst)
-            setattr(inst, self._name, importers)
-            return importers
-        return self
+# Names from the namespaces of a LazyImporter class and its bases that can't
+# be used for imports, cached per class as they are the same for every instance.
+# Classes used as keys are kept alive by this dict, including any created at runtime.
+_RESERVED_NAMES_CACHE = {}
 
-    @staticmethod
-    def group_importers(inst):
-        """
-        Take a LazyImporter and return the dictionary of names to _ImportBase subclasses
-        needed to perform the lazy imports.
-
-        ModuleImport instances with the same base module and no 'asname' are grouped in
-        order to allow access to any of the submodules. As there is no way to know which
-        submodule is being accessed all are imported when the base module is first
-        accessed.
-
-        This is kept outside of the LazyImporter class to keep the namespace of
-        LazyImporter minimal. It should be called when the `_importers` attribute
-        is first accessed on an instance.
-
-        :param inst: LazyImporter instance
-        :type inst: LazyImporter
-        :return: lazy importers attribute dict mapping to the objects that
-                 perform the imports
-        :rtype: dict[str, ImportBase]
-        """
-        importers = {}
 
-        reserved_names = vars(type(inst)).keys() | vars(inst).keys()
+def _group_importers(importer):
+    """
+    Take a LazyImporter and return the dictionary of names to ImportBase subclasses
+    needed to perform the lazy imports.
 
-        for imp in inst._imports:  # noqa
-            if getattr(imp, "import_level", 0) > 0 and inst._globals is None:  # noqa
-                raise ValueError(
-                    "Attempted to setup relative import without providing globals()."
-                )
+    This is kept outside of the LazyImporter class to keep the namespace of
+    LazyImporter minimal. It is called when the importers are first needed
+    and the result is stored as `_importers` on the instance.
 
-            # import x, import x.y as z OR from x import y
-            if asname := getattr(imp, "asname", None):
-                if asname in reserved_names:
-                    raise ValueError(f"{asname!r} clashes with a LazyImporter internal name.")
-                if asname in importers:
-                    raise ValueError(f"{asname!r} used for multiple imports.")
-                importers[asname] = imp
+    :param importer: LazyImporter instance
+    :type importer: LazyImporter
+    :return: lazy importers attribute dict mapping to the objects that
+             perform the imports
+    :rtype: dict[str, ImportBase]
+    """
+    importer_type = type(importer)
+    reserved_names = _RESERVED_NAMES_CACHE.get(importer_type)
+    if reserved_names is None:
+        # Include base classes, the slots for the internal attributes
+        # are defined on LazyImporter and not on subclasses
+        reserved_names = _RESERVED_NAMES_CACHE[importer_type] = frozenset().union(
+            *(vars(c) for c in importer_type.__mro__ if c is not object)
+        )
+
+    # Only combine with the instance names if there are any
+    instance_dict = vars(importer)
+    if instance_dict:
+        reserved_names = reserved_names | instance_dict.keys()
+
+    return _group_imports(
+        importer._imports,  # noqa
+        importer._globals,  # noqa
+        reserved_names,
+    )
+
+
+def _group_imports(imports, globs, reserved_names=frozenset()):
+    """
+    Return the dictionary of names to ImportBase subclasses for a list of imports.
+
+    :param imports: list of imports
+    :type imports: list[ImportBase]
+    :param globs: globals object for relative imports
+    :type globs: dict[str, typing.Any] | None
+    :param reserved_names: names that can not be used for imports
+    :type reserved_names: typing.Container[str]
+    :return: dict mapping each name to the object that performs its import
+    :rtype: dict[str, ImportBase]
+    """
+    importers = {}
+
+    for imp in imports:
+        # globals are usually available, so check them before the import level
+        if globs is None and getattr(imp, "import_level", 0) > 0:
+            raise ValueError(
+                "Attempted to setup relative import without providing globals()."
+            )
 
+        # Check the exact type for the builtin importers to avoid the getattr calls
+        imp_type = type(imp)
+        if imp_type is MultiFromImport:
             # from x import y, z ...
-            elif asnames := getattr(imp, "asnames", None):
-                for asname in asnames:
-                    if asname in reserved_names:
-                        raise ValueError(f"{asname!r} clashes with a LazyImporter internal name.")
-                    if asname in importers:
-                        raise ValueError(f"{asname!r} used for multiple imports.")
-                    importers[asname] = imp
+            asnames = imp.asnames
+        elif imp_type in _SINGLE_NAME_IMPORTS:
+            # import x, import x.y as z OR from x import y
+            asnames = (imp.asname,)
+        else:
+            # Other ImportBase subclasses
+            asname = getattr(imp, "asname", None)
+            asnames = (asname,) if asname else getattr(imp, "asnames", None)
 
-            else:
+            if not asnames:
                 raise TypeError(
                     f"{imp!r} is not an instance of "
                     f"ModuleImport, FromImport, MultiFromImport or TryExceptImport"
                 )
-        return importers
+
+        for asname in asnames:
+            if asname in reserved_names:
+                raise ValueError(f"{asname!r} clashes with a LazyImporter internal name.")
+            if asname in importers:
+                raise ValueError(f"{asname!r} used for multiple imports.")
+            importers[asname] = imp
+
+    return importers
 
 
 class LazyImporter:
+    # __dict__ is kept as imported attributes are stored on the instance
+    __slots__ = (
+        "_imports",
+        "_globals",
+        "_importers",
+        "_dir_cache",
+        "_eager_import",
+        "_eager_process",
+        "__dict__",
+        "__weakref__",
+    )
+
     _imports: "list[ImportBase]"
     _globals: "dict | None"
-
-    _importers = _ImporterGrouper()
+    _importers: "dict[str, ImportBase] | None"
+    _dir_cache: "tuple[str, ...] | None"
 
     def __init__(self, imports=None, *, globs=None, eager_process=None, eager_import=None):
         """
@@ -675,8 +753,12 @@ class LazyImporter:
             or (EAGER_PROCESS and eager_process is None)
         )
 
+        # Grouped lazily on first use unless eager processing is requested
+        self._importers = None
+        self._dir_cache = None
+
         if self._eager_process:
-            _ = self._importers
+            self._importers = _group_importers(self)
 
         if self._eager_import:
             force_imports(self)
@@ -686,23 +768,35 @@ class LazyImporter:
         # and sets the result to that name.
         # If the name is linked to a MultiFromImport all of the attributes are
         # set when the first is accessed.
-        try:
-            importer = self._importers[name]
-        except KeyError:
+        importers = self._importers
+        if importers is None:
+            importers = self._importers = _group_importers(self)
+
+        # Missing names are common with hasattr/getattr probes, avoid the
+        # cost of catching a KeyError for them.
+        importer = importers.get(name)
+        if importer is None:
             raise AttributeError(
                 f"{self.__class__.__name__!r} object has no attribute {name!r}"
             )
 
         import_data = importer.import_objects(globs=self._globals)
-        for key, value in import_data.items():
-            setattr(self, key, value)
 
-        obj = import_data[name]
+        # Store directly in the instance dict so later access skips __getattr__
+        self.__dict__.update(import_data)
 
-        return obj
+        return import_data[name]
 
     def __dir__(self):
-        return sorted(self._importers.keys())
+        dir_cache = self._dir_cache
+        if dir_cache is None:
+            importers = self._importers
+            if importers is None:
+                importers = self._importers = _group_importers(self)
+            dir_cache = self._dir_cache = tuple(sorted(importers.keys()))
+
+        # dir() builds its own sorted list from this, so no copy is needed
+        return dir_cache
 
     def __repr__(self):
         return (
@@ -722,15 +816,18 @@ def get_importer_state(importer):
     :rtype: dict[str, dict[str, typing.Any] | list[str]]
     """
     # Get the dir *before* looking at __dict__
-    # Calling 'dir' in the block would cause the __dict__ size to change
-    # And fail iteration
+    # dir may need to group the importers on first use
     importer_dir = dir(importer)
+    importer_dict = importer.__dict__
 
-    imported_attributes = {
-        k: v for k, v in importer.__dict__.items() if k in importer_dir
-    }
+    imported_attributes = {}
+    lazy_attributes = []
 
-    lazy_attributes = [k for k in importer_dir if k not in imported_attributes]
+    for name in importer_dir:
+        if name in importer_dict:
+            imported_attributes[name] = importer_dict[name]
+        else:
+            lazy_attributes.append(name)
 
     return {
         "imported_attributes": imported_attributes,
@@ -771,24 +868,36 @@ def get_module_funcs(importer, module_name=None):
             except (AttributeError, ValueError):
                 pass
 
+    def is_lazy_name(name):
+        # Check against the current importers so names added later with
+        # extend_imports are found, without exposing LazyImporter internals
+        importers = importer._importers
+        if importers is None:
+            importers = importer._importers = _group_importers(importer)
+        return name in importers
+
     if module_name:
-        mod = sys.modules[module_name]
-        dir_data = sorted(list(mod.__dict__.keys()) + dir(importer))
+        mod_dict = sys.modules[module_name].__dict__
+        dir_data = sorted(mod_dict.keys() | set(dir(importer)))
 
         def __getattr__(name):
-            try:
-                attr = getattr(importer, name)
-            except AttributeError:
+            if not is_lazy_name(name):
                 raise AttributeError(
                     f"module {module_name!r} has no attribute {name!r}"
                 )
-            setattr(mod, name, attr)
+            attr = getattr(importer, name)
+            # Store in the module namespace so __getattr__ is not called again
+            mod_dict[name] = attr
             return attr
 
     else:
         dir_data = dir(importer)
 
         def __getattr__(name):
+            if not is_lazy_name(name):
+                raise AttributeError(
+                    f"{importer.__class__.__name__!r} object has no attribute {name!r}"
+                )
             return getattr(importer, name)
 
     def __dir__():
@@ -797,6 +906,58 @@ def get_module_funcs(importer, module_name=None):
     return __getattr__, __dir__
 
 
+def install_lazy(module_name, imports):
+    """
+    Install __getattr__ and __dir__ functions on a module that perform the
+    given imports when the names are first accessed on the module.
+
+    Unlike get_module_funcs this does not create a LazyImporter, the
+    __getattr__ function looks up the importers directly and places the
+    imported objects in the module namespace.
+
+    Any existing __getattr__ or __dir__ functions will be replaced. Imports
+    may not use the name of an existing module attribute, '__getattr__'
+    or '__dir__'.
+
+    :param module_name: Name of the module to install the functions on.
+                        Usually `__name__`.
+    :type module_name: str
+    :param imports: list of imports
+    :type imports: list[ImportBase]
+    """
+    mod_dict = sys.modules[module_name].__dict__
+    importers = _group_imports(
+        imports,
+        mod_dict,
+        reserved_names={"__getattr__", "__dir__"} | mod_dict.keys(),
+    )
+    importers_get = importers.get
+
+    def __getattr__(name):
+        importer = importers_get(name)
+        if importer is None:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            )
+
+        import_data = importer.import_objects(globs=mod_dict)
+        mod_dict.update(import_data)
+
+        return import_data[name]
+
+    def __dir__():
+        return sorted(mod_dict.keys() | importers.keys())
+
+    mod_dict["__getattr__"] = __getattr__
+    mod_dict["__dir__"] = __dir__
+
+    if EAGER_IMPORT:
+        for name in importers:
+            # Names from a MultiFromImport may already be set by an earlier import
+            if name not in mod_dict:
+                __getattr__(name)
+
+
 def force_imports(importer):
     """
     Force the importer to perform all imports.
@@ -830,16 +991,14 @@ def extend_imports(importer, imports):
             redo_imports.append(key)
 
     # Clear out the importers cache
-    try:
-        del importer._importers
-    except AttributeError:
-        pass
+    importer._importers = None
+    importer._dir_cache = None
 
     # Add the new imports and do any necessary processing
     importer._imports.extend(imports)
 
     if importer._eager_process:
-        _ = importer._importers
+        importer._importers = _group_importers(importer)
 
     if importer._eager_import:
         force_imports(importer)
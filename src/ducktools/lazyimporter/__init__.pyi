@@ -1,8 +1,8 @@
-import abc
 from typing import (
     Any,
+    ClassVar,
+    Container,
     TypedDict,
-    overload,
     type_check_only,
 )
 import types
@@ -19,24 +19,34 @@ __all__: list[str] = [
     "ImportBase",
     "get_importer_state",
     "get_module_funcs",
+    "install_lazy",
     "force_imports",
 ]
 
 EAGER_PROCESS: bool
 EAGER_IMPORT: bool
 
-class ImportBase(metaclass=abc.ABCMeta):
-    module_name: str
+def _parse_module_name(
+    module_name: str,
+) -> tuple[str, str, int, str, tuple[str, ...]]: ...
+def _validate_identifier(name: str) -> str: ...
+
+class ImportBase:
+    _fields: ClassVar[tuple[str, ...] | None]
+    _module_name: str
+    module_name_noprefix: str
+    import_level: int
+    module_basename: str
+    submodule_names: tuple[str, ...]
 
     @property
-    def module_name_noprefix(self) -> str: ...
-    @property
-    def import_level(self) -> int: ...
-    @property
-    def module_basename(self) -> str: ...
-    @property
-    def submodule_names(self) -> list[str]: ...
-    @abc.abstractmethod
+    def module_name(self) -> str: ...
+    @module_name.setter
+    def module_name(self, value: str) -> None: ...
+    def __repr__(self) -> str: ...
+    def _key(self) -> tuple[Any, ...]: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
     def import_objects(
         self, globs: dict[str, Any] | None = ...
     ) -> dict[str, types.ModuleType | Any]: ...
@@ -46,8 +56,6 @@ class ModuleImport(ImportBase):
     asname: str
 
     def __init__(self, module_name: str, asname: str | None = ...) -> None: ...
-    def __repr__(self) -> str: ...
-    def __eq__(self, other) -> bool: ...
     def import_objects(
         self, globs: dict[str, Any] | None = ...
     ) -> dict[str, types.ModuleType]: ...
@@ -60,33 +68,35 @@ class FromImport(ImportBase):
     def __init__(
         self, module_name: str, attrib_name: str, asname: str | None = ...
     ) -> None: ...
-    def __repr__(self) -> str: ...
-    def __eq__(self, other) -> bool: ...
     def import_objects(self, globs: dict[str, Any] | None = ...) -> dict[str, Any]: ...
 
 class MultiFromImport(ImportBase):
     module_name: str
-    attrib_names: list[str | tuple[str, str]]
+    attrib_pairs: tuple[tuple[str, str], ...]
+    asnames: tuple[str, ...]
+
+    @property
+    def attrib_names(self) -> list[str | tuple[str, str]]: ...
 
     def __init__(
         self, module_name: str, attrib_names: list[str | tuple[str, str]]
     ) -> None: ...
-    def __repr__(self) -> str: ...
-    def __eq__(self, other) -> bool: ...
-    @property
-    def asnames(self): ...
     def import_objects(self, globs: dict[str, Any] | None = ...) -> dict[str, Any]: ...
 
-class _TryExceptImportMixin(metaclass=abc.ABCMeta):
-    except_module: str
-    @property
-    def except_import_level(self) -> int: ...
-    @property
-    def except_module_noprefix(self) -> str: ...
-    @property
-    def except_module_basename(self) -> str: ...
+class _TryExceptImportMixin(ImportBase):
+    _except_module: str
+    except_module_noprefix: str
+    except_import_level: int
+    except_module_basename: str
+    except_module_names: tuple[str, ...]
+
     @property
-    def except_module_names(self) -> list[str]: ...
+    def except_module(self) -> str: ...
+    @except_module.setter
+    def except_module(self, value: str) -> None: ...
+    def _import_module(
+        self, globs: dict[str, Any] | None = ...
+    ) -> tuple[types.ModuleType, bool]: ...
 
 class TryExceptImport(_TryExceptImportMixin, ImportBase):
     module_name: str
@@ -94,8 +104,6 @@ class TryExceptImport(_TryExceptImportMixin, ImportBase):
     asname: str
 
     def __init__(self, module_name: str, except_module: str, asname: str) -> None: ...
-    def __repr__(self) -> str: ...
-    def __eq__(self, other) -> bool: ...
     def import_objects(self, globs: dict[str, Any] | None = ...) -> dict[str, Any]: ...
 
 class TryExceptFromImport(_TryExceptImportMixin, ImportBase):
@@ -112,8 +120,6 @@ class TryExceptFromImport(_TryExceptImportMixin, ImportBase):
         except_attribute: str,
         asname: str,
     ) -> None: ...
-    def __repr__(self) -> str: ...
-    def __eq__(self, other) -> bool: ...
     def import_objects(self, globs: dict[str, Any] | None = ...) -> dict[str, Any]: ...
 
 class TryFallbackImport(ImportBase):
@@ -127,29 +133,22 @@ class TryFallbackImport(ImportBase):
                 fallback: Any,
                 asname: str | None = None,
         ) -> None: ...
-        def __repr__(self) -> str: ...
-        def __eq__(self, other) -> bool: ...
         def import_objects(self, globs: dict[str, Any] | None = ...) -> dict[str, Any]: ...
 
-class _ImporterGrouper:
-    def __init__(self) -> None: ...
-    def __set_name__(self, owner, name) -> None: ...
-    @overload
-    def __get__(
-        self, inst: None, cls: type[LazyImporter] | None = ...
-    ) -> _ImporterGrouper: ...
-    @overload
-    def __get__(
-        self, inst: LazyImporter, cls: type[LazyImporter] | None = ...
-    ) -> dict[str, ImportBase]: ...
-    @staticmethod
-    def group_importers(inst: LazyImporter) -> dict[str, ImportBase]: ...
+def _group_importers(importer: LazyImporter) -> dict[str, ImportBase]: ...
+def _group_imports(
+    imports: list[ImportBase],
+    globs: dict[str, Any] | None,
+    reserved_names: Container[str] = ...,
+) -> dict[str, ImportBase]: ...
 
 class LazyImporter:
     _imports: list[ImportBase]
     _globals: dict | None
-
-    _importers: _ImporterGrouper
+    _importers: dict[str, ImportBase] | None
+    _dir_cache: tuple[str, ...] | None
+    _eager_import: bool
+    _eager_process: bool
 
     def __init__(
         self,
@@ -160,7 +159,7 @@ class LazyImporter:
         eager_import: bool | None = ...,
     ) -> None: ...
     def __getattr__(self, name: str) -> types.ModuleType | Any: ...
-    def __dir__(self): ...
+    def __dir__(self) -> tuple[str, ...]: ...
 
 @type_check_only
 class _ImporterState(TypedDict):
@@ -174,5 +173,6 @@ def get_module_funcs(
     importer: LazyImporter,
     module_name: str | None = ...,
 ) -> tuple[types.FunctionType, types.FunctionType]: ...
+def install_lazy(module_name: str, imports: list[ImportBase]) -> None: ...
 def force_imports(importer: LazyImporter) -> None: ...
 def extend_imports(importer: LazyImporter, imports: list[ImportBase]) -> None: ...
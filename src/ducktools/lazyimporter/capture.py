@@ -15,14 +15,20 @@ class CaptureError(Exception):
 # This intentionally does **not** define an '__eq__' or '__hash__'
 # Two placeholders are only identical if they are the same object as otherwise it's
 # not possible to trace imports back correctly.
+# This and the Captured*Import classes are internal and not intended to be subclassed,
+# they are checked with `type(obj) is cls`.
 class _ImportPlaceholder:
-    __slots__ = ("attrib_name", "placeholder_parent", "capturer")
+    __slots__ = ("attrib_name", "placeholder_parent", "placeholder_root", "capturer")
 
     def __init__(self, capturer, attrib_name=None, parent=None):
         self.capturer = capturer
         self.attrib_name = attrib_name
         self.placeholder_parent = parent
 
+        # The original placeholder returned by the import, this is the one
+        # the captured imports are matched against
+        self.placeholder_root = parent.placeholder_root if parent is not None else self
+
     def __repr__(self):  # pragma: nocover
         return (
             f"{self.__class__.__name__}("
@@ -40,12 +46,15 @@ class _ImportPlaceholder:
 
 # Temporary importers needed for tracking back to assigned names
 class CapturedModuleImport:
-    __slots__ = ("module_name", "placeholder")
+    __slots__ = ("module_name", "placeholder", "final_element")
 
     def __init__(self, module_name, placeholder):
         self.module_name = module_name
         self.placeholder = placeholder
 
+        # Last part of the module name, used to match the placeholder attribute
+        self.final_element = module_name.rpartition(".")[2]
+
     def __repr__(self):  # pragma: nocover
         return (
             f"{self.__class__.__name__}("
@@ -54,10 +63,6 @@ class CapturedModuleImport:
             f")"
         )
 
-    @property
-    def final_element(self):
-        return self.module_name.split(".")[-1]
-
 
 class CapturedFromImport:
     __slots__ = ("module_name", "attrib_name", "placeholder")
@@ -110,24 +115,29 @@ class capture_imports:
         self.previous_import_func = None
 
     def _make_capturing_import(self):
+        # Bind these once so each captured import only uses closure lookups
+        capture_globs = self.globs
+        previous_import_func = self.previous_import_func
+        captured_imports = self.captured_imports
+
         def _capturing_import(name, globals=None, locals=None, fromlist=(), level=0):
             # Something else tried to import - redirect to regular machinery
-            if globals is not self.globs or globals != locals:
-                return self.previous_import_func(name, globals, locals, fromlist, level)
+            if globals is not capture_globs or globals is not locals:
+                return previous_import_func(name, globals, locals, fromlist, level)
 
-            if fromlist and "*" in fromlist:
+            # 'from x import *' always gives a fromlist of ('*',)
+            if fromlist and fromlist[0] == "*":
                 raise CaptureError("Lazy importers cannot capture '*' imports.")
 
             # Make a unique placeholder object
             placeholder = _ImportPlaceholder(
                 capturer=self,
-                attrib_name=name.split(".")[0],
+                attrib_name=name.partition(".")[0],
             )
 
             leading_dots = "." * level
             module_name = f"{leading_dots}{name}"
 
-            captured_imports = self.captured_imports
             if fromlist:
                 captured_imports.extend(
                     [
@@ -210,14 +220,12 @@ class capture_imports:
         # First create a mapping from placeholder instances to attribute names, to importers
         placeholders = {}
         for importer in self.captured_imports:
-            importer_placeholders = placeholders.get(importer.placeholder, {})
-            if isinstance(importer, CapturedModuleImport):
+            importer_placeholders = placeholders.setdefault(importer.placeholder, {})
+            if type(importer) is CapturedModuleImport:
                 importer_placeholders[importer.final_element] = importer
             else:
                 importer_placeholders[importer.attrib_name] = importer
 
-            placeholders[importer.placeholder] = importer_placeholders
-
         final_imports = []  # List of ModuleImport and MultiFromImport
         from_imports = {}  # dict of module_name: [(attrib, asname), ..]
 
@@ -225,58 +233,57 @@ class capture_imports:
         # After all are matched then raise an exception
         importer_set = set(self.captured_imports)
 
-        # Copy as the original may be mutated.
+        # Find the placeholders first as globals is mutated while they are processed
         # `key` in this case will be the name the attribute was assigned
-        for key, value in self.globs.copy().items():
-            if isinstance(value, _ImportPlaceholder) and value.capturer is self:
-                # Store the initial attribute name and seek upwards through
-                # parent placeholders to try to find the original placeholder
-                attrib_name = value.attrib_name
-                while parent := value.placeholder_parent:
-                    value = parent
-
-                # Get the {attribute name: importer, ...} mappings
-                importer_map = placeholders[value]
-
-                if attrib_name:
-                    # Retrieve the captured import statement from the mapping
-                    try:
-                        capture = importer_map[attrib_name]
-                    except KeyError:
-                        # Search the capture map to see if this is a submodule import
-                        for cap_imp in importer_map.values():
-                            if cap_imp.module_name.split(".")[0] == attrib_name:
-                                asname = cap_imp.module_name.split(".")[-1]
-                                raise CaptureError(
-                                    f"Submodule import `import {cap_imp.module_name}` requires assigned name: "
-                                    f"eg `import {cap_imp.module_name} as {asname}`"
-                                )
-
-                        # I don't know of a case where this can currently happen
-                        # But this is still an error so raise here
-                        raise  # pragma: nocover
-
-                    # Remove used importers from the set
-                    importer_set.discard(capture)
-
-                    # Convert it to a regular ModuleImport or store it to make
-                    # a MultiFromImport at the end.
-                    if isinstance(capture, CapturedModuleImport):
-                        importer = ModuleImport(
-                            capture.module_name,
-                            asname=key,
-                        )
-                        final_imports.append(importer)
-                    else:
-                        try:
-                            pairs = from_imports[capture.module_name]
-                        except KeyError:
-                            pairs = []
-                            from_imports[capture.module_name] = pairs
-
-                        pairs.append((attrib_name, key))
+        captured_names = [
+            (key, value)
+            for key, value in self.globs.items()
+            if type(value) is _ImportPlaceholder and value.capturer is self
+        ]
+
+        for key, value in captured_names:
+            # Store the initial attribute name and use the root placeholder
+            # to find the original import
+            attrib_name = value.attrib_name
+
+            # Get the {attribute name: importer, ...} mappings
+            importer_map = placeholders[value.placeholder_root]
+
+            if attrib_name:
+                # Retrieve the captured import statement from the mapping
+                try:
+                    capture = importer_map[attrib_name]
+                except KeyError:
+                    # Search the capture map to see if this is a submodule import
+                    for cap_imp in importer_map.values():
+                        if cap_imp.module_name.split(".")[0] == attrib_name:
+                            asname = cap_imp.module_name.split(".")[-1]
+                            raise CaptureError(
+                                f"Submodule import `import {cap_imp.module_name}` requires assigned name: "
+                                f"eg `import {cap_imp.module_name} as {asname}`"
+                            )
+
+                    # I don't know of a case where this can currently happen
+                    # But this is still an error so raise here
+                    raise  # pragma: nocover
+
+                # Remove used importers from the set
+                importer_set.discard(capture)
+
+                # Convert it to a regular ModuleImport or store it to make
+                # a MultiFromImport at the end.
+                if type(capture) is CapturedModuleImport:
+                    importer = ModuleImport(
+                        capture.module_name,
+                        asname=key,
+                    )
+                    final_imports.append(importer)
+                else:
+                    from_imports.setdefault(capture.module_name, []).append(
+                        (attrib_name, key)
+                    )
 
-                    del self.globs[key]
+                del self.globs[key]
 
         # importer_set should be empty
         # If it was not then there were import statements that did not have
@@ -286,7 +293,7 @@ class capture_imports:
             missing_module_imports = []
             missing_from_imports = []
             for imp in importer_set:
-                if isinstance(imp, CapturedModuleImport):
+                if type(imp) is CapturedModuleImport:
                     missing_module_imports.append(repr(imp.module_name))
                 else:
                     missing_from_imports.append(repr(imp.attrib_name))
@@ -301,7 +308,7 @@ class capture_imports:
                 err_list = ", ".join(missing_from_imports)
                 raise CaptureError(f"Imports for name(s) {err_list} found, but unused.")
 
-        final_imports.extend([MultiFromImport(k, v) for k, v in from_imports.items()])
+        final_imports.extend(MultiFromImport(k, v) for k, v in from_imports.items())
 
         # Add these imports to the importer
         extend_imports(self.importer, final_imports)
@@ -10,7 +10,8 @@ class CaptureError(Exception):
 class _ImportPlaceholder:
     capturer: capture_imports
     attrib_name: str
-    placeholder_parent: _ImportPlaceholder
+    placeholder_parent: _ImportPlaceholder | None
+    placeholder_root: _ImportPlaceholder
 
     def __init__(
         self,
@@ -25,12 +26,10 @@ class _ImportPlaceholder:
 class CapturedModuleImport:
     module_name: str
     placeholder: _ImportPlaceholder
+    final_element: str
 
     def __init__(self, module_name: str, placeholder: _ImportPlaceholder) -> None: ...
-    def __eq__(self, other) -> bool: ...
     def __repr__(self) -> str: ...
-    @property
-    def final_element(self) -> str: ...
 
 class CapturedFromImport:
     module_name: str
@@ -38,7 +37,6 @@ class CapturedFromImport:
     placeholder: _ImportPlaceholder
 
     def __init__(self, module_name: str, attrib_name: str, placeholder: _ImportPlaceholder) -> None: ...
-    def __eq__(self, other) -> bool: ...
     def __repr__(self) -> str: ...
 
 
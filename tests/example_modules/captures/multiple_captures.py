@@ -0,0 +1,10 @@
+from ducktools.lazyimporter import LazyImporter
+from ducktools.lazyimporter.capture import capture_imports
+
+laz = LazyImporter()
+
+with capture_imports(laz, auto_export=True):
+    import collections
+
+with capture_imports(laz, auto_export=False):
+    from functools import partial
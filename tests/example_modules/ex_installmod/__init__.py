@@ -0,0 +1,11 @@
+from ducktools.lazyimporter import (
+    FromImport,
+    install_lazy,
+)
+
+name = "ex_installmod"
+
+install_lazy(
+    __name__,
+    [FromImport("..ex_mod.ex_submod", "name", "submod_name")],
+)
@@ -1,4 +1,6 @@
+import builtins
 import sys
+import types
 
 import pytest
 
@@ -93,6 +95,19 @@ class TestDirectImports:
         assert laz.name == "ex_submod"
         assert laz.othername == "ex_submod2"
 
+    def test_submod_multifrom_asname(self, monkeypatch):
+        """
+        Submodules imported with an asname need to be in the fromlist
+        """
+        import ex_mod  # noqa  # pyright: ignore
+
+        monkeypatch.delitem(sys.modules, "ex_mod.ex_submod", raising=False)
+        monkeypatch.delattr(ex_mod, "ex_submod", raising=False)
+
+        laz = LazyImporter([MultiFromImport("ex_mod", [("ex_submod", "sm")])])
+
+        assert laz.sm.name == "ex_submod"
+
     def test_try_except_import(self):
         """
         Test a basic try/except import
@@ -146,6 +161,40 @@ class TestDirectImports:
 
         assert laz.name == "ex_submod"
 
+    def test_try_except_import_not_loaded(self, monkeypatch):
+        """
+        Test the 'try' import succeeding when the module is not in sys.modules
+        """
+        monkeypatch.delitem(sys.modules, "ex_mod", raising=False)
+        monkeypatch.delitem(sys.modules, "ex_mod.ex_submod", raising=False)
+
+        laz = LazyImporter(
+            [
+                TryExceptImport("ex_mod", "ex_othermod", "ex_mod"),
+                TryExceptImport("ex_mod.ex_submod", "ex_othermod", "ex_submod"),
+            ]
+        )
+
+        assert laz.ex_mod.name == "ex_mod"
+        assert laz.ex_submod.name == "ex_submod"
+
+    def test_try_except_from_import_not_loaded(self, monkeypatch):
+        """
+        Test the 'try' from import succeeding when the module is not in sys.modules
+        """
+        monkeypatch.delitem(sys.modules, "ex_mod", raising=False)
+        monkeypatch.delitem(sys.modules, "ex_mod.ex_submod", raising=False)
+
+        laz = LazyImporter(
+            [
+                TryExceptFromImport(
+                    "ex_mod.ex_submod", "name2", "ex_othermod", "name", "name2"
+                ),
+            ]
+        )
+
+        assert laz.name2 == "ex_submod2"
+
     def test_try_fallback_import(self):
         # noinspection PyUnresolvedReferences
         import ex_mod
@@ -176,6 +225,77 @@ class TestDirectImports:
         assert laz.module_name is test_obj
 
 
+class TestLoadedModules:
+    def test_loaded_modules_skip_import(self, monkeypatch):
+        """
+        Modules already in sys.modules should not go through __import__
+        """
+        import collections
+        import collections.abc
+
+        laz = LazyImporter(
+            [
+                ModuleImport("collections"),
+                ModuleImport("collections.abc", "cabc"),
+                FromImport("collections", "namedtuple"),
+                MultiFromImport("collections", ["defaultdict", ("OrderedDict", "od")]),
+                TryExceptImport("collections.abc", "module_does_not_exist", "tcabc"),
+                TryExceptFromImport(
+                    "collections", "deque", "module_does_not_exist", "deque", "dq"
+                ),
+                TryFallbackImport("collections", None, "fallback_collections"),
+            ]
+        )
+
+        def fail_import(*args, **kwargs):
+            raise ImportError("__import__ should not be called")
+
+        monkeypatch.setattr(builtins, "__import__", fail_import)
+
+        collections_mod = laz.collections
+        cabc_mod = laz.cabc
+        namedtuple = laz.namedtuple
+        defaultdict = laz.defaultdict
+        od = laz.od
+        tcabc_mod = laz.tcabc
+        dq = laz.dq
+        fallback_collections = laz.fallback_collections
+
+        monkeypatch.undo()
+
+        assert collections_mod is collections
+        assert cabc_mod is collections.abc
+        assert namedtuple is collections.namedtuple
+        assert defaultdict is collections.defaultdict
+        assert od is collections.OrderedDict
+        assert tcabc_mod is collections.abc
+        assert dq is collections.deque
+        assert fallback_collections is collections
+
+    def test_initializing_module_uses_import(self, monkeypatch):
+        """
+        Partially initialized modules should go through __import__
+        """
+        mod = types.ModuleType("ducktools_initializing_mod")
+        mod.__spec__ = types.SimpleNamespace(_initializing=True)
+        monkeypatch.setitem(sys.modules, "ducktools_initializing_mod", mod)
+
+        import_calls = []
+
+        def recording_import(name, *args, **kwargs):
+            import_calls.append(name)
+            return mod
+
+        laz = LazyImporter([ModuleImport("ducktools_initializing_mod")])
+
+        monkeypatch.setattr(builtins, "__import__", recording_import)
+        result = laz.ducktools_initializing_mod
+        monkeypatch.undo()
+
+        assert result is mod
+        assert import_calls == ["ducktools_initializing_mod"]
+
+
 class TestRelativeImports:
     def test_relative_import(self):
         import example_modules.lazy_submod_ex as lse
@@ -197,11 +317,11 @@ class TestEager:
     def test_eager_process(self):
         laz = LazyImporter([ModuleImport("functools")], eager_process=False)
 
-        assert "_importers" not in vars(laz)
+        assert laz._importers is None
 
         laz = LazyImporter([ModuleImport("functools")], eager_process=True)
 
-        assert "_importers" in vars(laz)
+        assert laz._importers is not None
 
     def test_eager_import(self):
         laz = LazyImporter([ModuleImport("functools")], eager_import=False)
@@ -219,29 +339,29 @@ class TestEager:
 
         # EAGER_PROCESS = False and no value - should lazily process
         laz = LazyImporter([ModuleImport("functools")])
-        assert "_importers" not in vars(laz)
+        assert laz._importers is None
 
         # EAGER_PROCESS = False and eager_process = False - should lazily process
         laz = LazyImporter([ModuleImport("functools")], eager_process=False)
-        assert "_importers" not in vars(laz)
+        assert laz._importers is None
 
         # EAGER_PROCESS = False and eager_process = True - should eagerly process
         laz = LazyImporter([ModuleImport("functools")], eager_process=True)
-        assert "_importers" in vars(laz)
+        assert laz._importers is not None
 
         lazyimporter.EAGER_PROCESS = True
 
         # EAGER_PROCESS = True and no value - should eagerly process
         laz = LazyImporter([ModuleImport("functools")])
-        assert "_importers" in vars(laz)
+        assert laz._importers is not None
 
         # EAGER_PROCESS = True and eager_process = False - should lazily process
         laz = LazyImporter([ModuleImport("functools")], eager_process=False)
-        assert "_importers" not in vars(laz)
+        assert laz._importers is None
 
         # EAGER_PROCESS = True and eager_process = True - should eagerly process
         laz = LazyImporter([ModuleImport("functools")], eager_process=True)
-        assert "_importers" in vars(laz)
+        assert laz._importers is not None
 
         # Restore state
         lazyimporter.EAGER_PROCESS = initial_state
@@ -229,3 +229,11 @@ class TestModuleCaptures:
 
         assert mod.inner_import is functools
         assert mod.InnerClass.typing is typing
+
+    def test_multiple_captures(self):
+        import collections, functools
+        import example_modules.captures.multiple_captures as mod
+
+        assert mod.collections is collections
+        # Added to the importer after the module functions were created
+        assert mod.partial is functools.partial
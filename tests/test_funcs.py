@@ -1,6 +1,12 @@
 """
 Test the external functions
 """
+import sys
+import types
+
+import pytest
+
+import ducktools.lazyimporter as lazyimporter
 
 from ducktools.lazyimporter import (
     ModuleImport,
@@ -10,8 +16,10 @@ from ducktools.lazyimporter import (
     MultiFromImport,
     get_importer_state,
     get_module_funcs,
+    install_lazy,
     LazyImporter,
     force_imports,
+    extend_imports,
 )
 
 
@@ -47,7 +55,7 @@ class TestModuleFuncs:
 
         _, dir_func = get_module_funcs(laz)
 
-        dir_vals = sorted(["collections", *globals().keys()])
+        dir_vals = sorted({"collections", *globals().keys()})
 
         assert dir_func() == dir_vals
 
@@ -62,6 +70,83 @@ class TestModuleFuncs:
         assert "name" in dir(ex_othermod)
         assert "submod_name" in dir(ex_othermod)
 
+    def test_getattr_module_internal_names(self):
+        import example_modules.ex_othermod as ex_othermod  # noqa  # pyright: ignore
+
+        with pytest.raises(AttributeError):
+            _ = ex_othermod._imports
+
+    def test_getattr_func_no_module_internal_names(self):
+        laz = LazyImporter([ModuleImport("collections")])
+
+        getattr_func, _ = get_module_funcs(laz, module_name="")
+
+        with pytest.raises(AttributeError):
+            getattr_func("_imports")
+
+    def test_getattr_func_extended(self):
+        import functools
+
+        laz = LazyImporter([ModuleImport("collections")])
+
+        getattr_func, _ = get_module_funcs(laz, module_name="")
+
+        extend_imports(laz, [FromImport("functools", "partial")])
+
+        assert getattr_func("partial") is functools.partial
+
+
+class TestInstallLazy:
+    def test_getattr_install(self):
+        import example_modules.ex_installmod as ex_installmod  # noqa  # pyright: ignore
+
+        assert ex_installmod.submod_name == "ex_submod"
+        assert "submod_name" in vars(ex_installmod)
+
+    def test_dir_install(self):
+        import example_modules.ex_installmod as ex_installmod  # noqa  # pyright: ignore
+
+        assert "name" in dir(ex_installmod)
+        assert "submod_name" in dir(ex_installmod)
+
+    def test_missing_install(self):
+        import example_modules.ex_installmod as ex_installmod  # noqa  # pyright: ignore
+
+        with pytest.raises(AttributeError) as e:
+            _ = ex_installmod.invalid
+
+        assert e.match(
+            "module 'example_modules.ex_installmod' has no attribute 'invalid'"
+        )
+
+    def test_install_reserved_names(self, monkeypatch):
+        mod = types.ModuleType("ex_install_reserved")
+        mod.existing = "existing"
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+
+        for asname in ["__getattr__", "__dir__", "existing"]:
+            with pytest.raises(ValueError) as e:
+                install_lazy(mod.__name__, [FromImport("functools", "partial", asname)])
+
+            assert e.match(f"'{asname}' clashes with a LazyImporter internal name.")
+
+        assert mod.existing == "existing"
+
+    def test_install_eager_import(self, monkeypatch):
+        import functools
+
+        mod = types.ModuleType("ex_install_eager")
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+        monkeypatch.setattr(lazyimporter, "EAGER_IMPORT", True)
+
+        install_lazy(
+            mod.__name__,
+            [MultiFromImport("functools", ["partial", ("reduce", "red")])],
+        )
+
+        assert vars(mod)["partial"] is functools.partial
+        assert vars(mod)["red"] is functools.reduce
+
 
 def test_force_imports():
     laz = LazyImporter([FromImport("example_modules.ex_mod", "name")])
@@ -77,3 +162,19 @@ def test_force_imports():
         "imported_attributes": {"name": "ex_mod"},
         "lazy_attributes": [],
     }
+
+
+def test_extend_imports():
+    laz = LazyImporter([ModuleImport("collections")])
+
+    assert dir(laz) == ["collections"]
+
+    collections_mod = laz.collections
+
+    extend_imports(laz, [FromImport("functools", "partial")])
+
+    assert dir(laz) == ["collections", "partial"]
+    assert get_importer_state(laz) == {
+        "imported_attributes": {"collections": collections_mod},
+        "lazy_attributes": ["partial"],
+    }
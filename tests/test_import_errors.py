@@ -6,6 +6,7 @@ from ducktools.lazyimporter import (
     MultiFromImport,
     TryExceptImport,
     TryExceptFromImport,
+    ImportBase,
     LazyImporter,
 )
 
@@ -88,6 +89,12 @@ class TestInvalidIdentifiers:
             )
         assert e.match(f"'##invalid_identifier##' is not a valid Python identifier.")
 
+    def test_keyword_invalid(self):
+        with pytest.raises(ValueError) as e:
+            _ = FromImport("modname", "attribute", "class")
+
+        assert e.match("'class' is not a valid Python identifier.")
+
 
 class TestNameClash:
     def test_moduleimport_clash(self):
@@ -154,6 +161,20 @@ class TestNameClash:
 
         assert e.match("'_importers' clashes with a LazyImporter internal name.")
 
+    def test_reserved_name_subclass(self):
+        class SubImporter(LazyImporter):
+            pass
+
+        with pytest.raises(ValueError) as e:
+            laz = SubImporter(
+                [
+                    FromImport("collections", "namedtuple", "_imports"),
+                ],
+                eager_process=True,
+            )
+
+        assert e.match("'_imports' clashes with a LazyImporter internal name.")
+
 class TestNoGlobals:
     def test_relative_module_noglobals(self):
         """
@@ -168,7 +189,7 @@ class TestNoGlobals:
         laz._globals = None
 
         with pytest.raises(ValueError) as e:
-            _ = laz._importers
+            _ = dir(laz)
 
         assert e.match(
             "Attempted to setup relative import without providing globals()."
@@ -187,7 +208,7 @@ class TestNoGlobals:
         laz._globals = None
 
         with pytest.raises(ValueError) as e:
-            _ = laz._importers
+            _ = dir(laz)
 
         assert e.match(
             "Attempted to setup relative import without providing globals()."
@@ -222,3 +243,15 @@ class TestImportErrors:
             _ = laz.fakemod
 
         assert e.match("No module named 'importlib.util.fakemod'")
+
+
+def test_import_objects_not_implemented():
+    class NoImportObjects(ImportBase):
+        def __init__(self, module_name, asname):
+            self.module_name = module_name
+            self.asname = asname
+
+    laz = LazyImporter([NoImportObjects("collections", "collections")])
+
+    with pytest.raises(NotImplementedError):
+        _ = laz.collections
@@ -1,4 +1,6 @@
 import itertools
+import sys
+import weakref
 
 from ducktools.lazyimporter import (
     ModuleImport,
@@ -6,7 +8,7 @@ from ducktools.lazyimporter import (
     MultiFromImport,
     TryExceptImport,
     TryExceptFromImport,
-    _ImporterGrouper,
+    ImportBase,
     LazyImporter,
 )
 
@@ -35,6 +37,11 @@ class TestImporterDunders:
 
         assert from1 != from2
 
+        # Same asname but a different attribute
+        from3 = FromImport("collections", "defaultdict", "namedtuple")
+
+        assert from1 != from3
+
     def test_equal_multifrom(self):
         mf1 = MultiFromImport("collections", ["namedtuple", "defaultdict"])
         mf2 = MultiFromImport("collections", ["namedtuple", "defaultdict"])
@@ -65,6 +72,18 @@ class TestImporterDunders:
         )
         assert te1 != te2
 
+    def test_hash_matches_equal(self):
+        imports = [
+            ModuleImport("collections"),
+            ModuleImport("collections"),
+            FromImport("collections", "namedtuple"),
+            MultiFromImport("collections", ["namedtuple", ("defaultdict", "dd")]),
+            MultiFromImport("collections", ["namedtuple", ("defaultdict", "dd")]),
+            TryExceptImport("tomllib", "tomli", "tomllib"),
+        ]
+
+        assert len(set(imports)) == 4
+
     def test_unequal_different_types(self):
         mod1 = ModuleImport("collections")
         from1 = FromImport("collections", "namedtuple")
@@ -105,6 +124,16 @@ class TestImporterDunders:
         )
         assert repr(mf1) == mf1str
 
+    def test_multifrom_attrib_names_copied(self):
+        attrib_names = ["namedtuple", ("defaultdict", "dd")]
+        mf1 = MultiFromImport("collections", attrib_names)
+
+        attrib_names.append("deque")
+
+        assert mf1.attrib_names == ["namedtuple", ("defaultdict", "dd")]
+        assert mf1.asnames == ("namedtuple", "dd")
+        assert mf1 == MultiFromImport("collections", ["namedtuple", ("defaultdict", "dd")])
+
     def test_import_repr_tryexcept(self):
         te1 = TryExceptImport(
             module_name='tomllib', except_module='tomli', asname='tomllib'
@@ -132,6 +161,18 @@ class TestImporterDunders:
 
         assert repr(tef1) == tef1str
 
+    def test_import_repr_subclass(self):
+        class SubModuleImport(ModuleImport):
+            pass
+
+        class NoFieldsImport(ImportBase):
+            pass
+
+        sub1 = SubModuleImport("collections", "c")
+
+        assert repr(sub1) == "SubModuleImport(module_name='collections', asname='c')"
+        assert repr(NoFieldsImport()).startswith("<")
+
     def test_importer_repr(self):
         globs = globals()
         imports = [ModuleImport("functools"), FromImport("collections", "namedtuple")]
@@ -227,6 +268,44 @@ class TestLevels:
             == "mod"
         )
 
+    def test_module_name_parts(self):
+        imp = ModuleImport("..pkg.mod.submod", "submod")
+
+        assert imp.module_name == "..pkg.mod.submod"
+        assert imp.module_name_noprefix == "pkg.mod.submod"
+        assert imp.import_level == 2
+        assert imp.module_basename == "pkg"
+        assert imp.submodule_names == ("mod", "submod")
+
+        # Reassigning the module name updates the parts
+        imp.module_name = "importlib.util"
+
+        assert imp.module_name_noprefix == "importlib.util"
+        assert imp.import_level == 0
+        assert imp.module_basename == "importlib"
+        assert imp.submodule_names == ("util",)
+
+    def test_names_interned(self):
+        # Build the strings at runtime so they are not interned as constants
+        mod_name = "".join(["collections", ".abc"])
+        asname = "".join(["c", "abc"])
+
+        imp = ModuleImport(mod_name, asname)
+
+        assert imp.module_name is sys.intern("collections.abc")
+        assert imp.asname is sys.intern("cabc")
+
+        from_imp = MultiFromImport("collections", [("".join(["named", "tuple"]), asname)])
+
+        assert from_imp.attrib_pairs[0][0] is sys.intern("namedtuple")
+        assert from_imp.asnames[0] is sys.intern("cabc")
+
+    def test_module_name_parts_shared(self):
+        imp1 = FromImport("collections.abc", "Mapping")
+        imp2 = TryExceptImport("tomllib", "collections.abc", "cabc")
+
+        assert imp1.submodule_names is imp2.except_module_names
+
     def test_relative_exceptimport_basename(self):
         tryexcept_imp_level = TryExceptImport(
             "..submodreal", "...submodexcept", "asname"
@@ -235,9 +314,57 @@ class TestLevels:
         assert tryexcept_imp_level.import_level == 2
         assert tryexcept_imp_level.except_import_level == 3
 
+    def test_except_module_parts(self):
+        imp = TryExceptImport("tomllib", "..pkg.mod.tomli", "toml")
+
+        assert imp.except_module == "..pkg.mod.tomli"
+        assert imp.except_module_noprefix == "pkg.mod.tomli"
+        assert imp.except_import_level == 2
+        assert imp.except_module_basename == "pkg"
+        assert imp.except_module_names == ("mod", "tomli")
+
+
+def test_importers_use_slots():
+    importers = [
+        ModuleImport("collections"),
+        FromImport("collections", "namedtuple"),
+        MultiFromImport("collections", ["namedtuple", "defaultdict"]),
+        TryExceptImport("tomllib", "tomli", "tomllib"),
+        TryExceptFromImport("tomllib", "loads", "tomli", "loads", "loads"),
+    ]
+
+    for imp in importers:
+        assert not hasattr(imp, "__dict__")
+
 
-def test_import_grouper_access():
+def test_importers_grouped_on_first_use():
     """
-    Test that the ImporterGrouper has been placed on the class
+    Test that the importers are only grouped when first needed
     """
-    assert isinstance(LazyImporter._importers, _ImporterGrouper)
+    importer = LazyImporter([ModuleImport("collections")])
+
+    assert importer._importers is None
+
+    assert dir(importer) == ["collections"]
+    assert importer._importers == {"collections": ModuleImport("collections")}
+
+
+def test_dir_cache_reused():
+    importer = LazyImporter([ModuleImport("collections")])
+
+    assert importer.__dir__() is importer.__dir__()
+    assert dir(importer) == ["collections"]
+
+
+def test_weakref_support():
+    importers = [
+        ModuleImport("collections"),
+        FromImport("collections", "namedtuple"),
+        MultiFromImport("collections", ["namedtuple", "defaultdict"]),
+        TryExceptImport("tomllib", "tomli", "tomllib"),
+        TryExceptFromImport("tomllib", "loads", "tomli", "loads", "loads"),
+        LazyImporter([]),
+    ]
+
+    for obj in importers:
+        assert weakref.ref(obj)() is obj